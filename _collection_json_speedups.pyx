@@ -0,0 +1,20 @@
+"""C accelerated helpers for collection_json."""
+
+
+def build_items(object item_class, object items, object build_item):
+    """Return a list with items converted to item_class instances.
+
+    Exact item_class instances and plain dicts are handled here; any other
+    value is passed to build_item(item_class, item).
+
+    """
+    cdef list result = []
+    cdef object item
+    for item in items:
+        if type(item) is item_class:
+            result.append(item)
+        elif type(item) is dict:
+            result.append(item_class(**item))
+        else:
+            result.append(build_item(item_class, item))
+    return result
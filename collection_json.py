@@ -1,10 +1,134 @@
 """Classes for representing a Collection+JSON document."""
 from __future__ import absolute_import, unicode_literals
 import json
+from operator import attrgetter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
 
 
 __version__ = '0.1.1'
 
+#: Use orjson, pysimdjson or ujson, when installed, instead of the standard
+#: library json module for parsing and serializing documents. Set to False to
+#: force the standard library implementation. Note that orjson parses integers
+#: which do not fit in 64 bits as floats, losing precision, and serializes
+#: NaN and Infinity as null.
+USE_FAST_JSON = True
+
+#: Cache the result of to_dict() on each object. Only enable this for
+#: documents which are not modified after being serialized: assigning an
+#: array or typed attribute (items, links, error, template, ...) or mutating
+#: an Array resets the cache of that object, but assigning a plain attribute
+#: (href, name, value, ...) does not, and neither reset reaches the objects
+#: containing it. The cached dictionaries are shared, so they must not be
+#: modified by the caller.
+CACHE_TO_DICT = False
+
+
+def _loads(data):
+    """Parse a json document from a string or bytes."""
+    if USE_FAST_JSON:
+        # the fast backends reject some documents the standard library
+        # accepts, such as NaN and Infinity, so retry those with it
+        try:
+            if orjson is not None:
+                return orjson.loads(data)
+            if simdjson is not None:
+                # documents keep references to parsed values, so build plain
+                # Python objects instead of proxies bound to a reusable parser
+                return simdjson.loads(data)
+            if ujson is not None:
+                return ujson.loads(data)
+        except ValueError:
+            pass
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def _dumps(obj):
+    """Serialize obj to a json formatted string."""
+    if USE_FAST_JSON:
+        # the fast backends reject some documents the standard library
+        # handles, such as integers beyond 64 bits
+        try:
+            if orjson is not None:
+                return orjson.dumps(
+                    obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+            if ujson is not None:
+                return ujson.dumps(obj, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            pass
+    return json.dumps(obj)
+
+
+def _from_dict_or_value(cls, value, expected='dict'):
+    """Return value as an instance of cls, building it from a dict if needed.
+
+    Raises `TypeError` when value is neither None, a dict nor a cls instance.
+
+    """
+    value_type = type(value)
+    if value is None or value_type is cls:
+        return value
+    if value_type is dict:
+        return cls(**value)
+    # rare case: subclasses of cls or dict
+    if isinstance(value, cls):
+        return value
+    if isinstance(value, dict):
+        return cls(**value)
+    raise TypeError("Invalid value '%s', "
+                    "expected %s or '%s'" % (value, expected, cls.__name__))
+
+
+def _build_item(item_class, item):
+    """Return item as an instance of item_class.
+
+    Slow path for Array items which are neither an exact item_class instance
+    nor a plain dict.
+
+    Raises `ValueError` when item cannot be converted.
+
+    """
+    if isinstance(item, item_class):
+        return item
+    if isinstance(item, dict):
+        return item_class(**item)
+    raise ValueError("Invalid value for %s: %r" % (item_class.__name__, item))
+
+
+def _py_build_items(item_class, items, build_item):
+    """Return a list with items converted to item_class instances.
+
+    Exact item_class instances and plain dicts are handled inline; any other
+    value is passed to build_item(item_class, item).
+
+    """
+    return [item if type(item) is item_class else
+            item_class(**item) if type(item) is dict else
+            build_item(item_class, item)
+            for item in items]
+
+
+try:
+    from _collection_json_speedups import build_items as _build_items
+except ImportError:  # pragma: no cover
+    _build_items = _py_build_items
+
 
 class ArrayProperty(object):
 
@@ -18,19 +142,18 @@ class ArrayProperty(object):
         """
         self.cls = cls
         self.name = name
+        self.attr = '_' + name
 
     def __get__(self, instance, owner):
-        target = instance
-        if target is None:
-            target = owner
-        if self.name in target.__dict__:
-            return target.__dict__[self.name]
-        raise AttributeError
+        if instance is None:
+            return self
+        return getattr(instance, self.attr)
 
     def __set__(self, instance, value):
         if value is None:
             value = []
-        instance.__dict__[self.name] = Array(self.cls, self.name, value)
+        setattr(instance, self.attr, Array(self.cls, self.name, value))
+        instance._dict_cache = None
 
 
 class DictProperty(object):
@@ -44,30 +167,24 @@ class DictProperty(object):
         """
         self.cls = cls
         self.name = name
+        self.attr = '_' + name
 
     def __get__(self, instance, owner):
-        target = instance
-        if target is None:
-            target = owner
-        if self.name in target.__dict__:
-            return target.__dict__[self.name]
-        raise AttributeError
+        if instance is None:
+            return self
+        return getattr(instance, self.attr)
 
     def __set__(self, instance, vals):
-        instance.__dict__[self.name] = {}
+        result = {}
+        setattr(instance, self.attr, result)
         if vals is not None:
             for name, value in vals.items():
-                if value is None or isinstance(value, self.cls):
-                    instance.__dict__[self.name][name] = value
-                elif isinstance(value, dict):
-                    instance.__dict__[self.name][name] = self.cls(**value)
-                elif isinstance(value, list):
-                    self.cls = self.cls
-                    instance.__dict__[self.name][name] = Array(self.cls, None, value)
+                if isinstance(value, (list, Array)):
+                    result[name] = Array(self.cls, None, value)
                 else:
-                    raise TypeError("Invalid value '%s', "
-                                    "expected dict, list or '%s'" % (value,
-                                                               self.cls.__name__))
+                    result[name] = _from_dict_or_value(self.cls, value,
+                                                       'dict, list')
+        instance._dict_cache = None
 
 
 class TypedProperty(object):
@@ -85,50 +202,76 @@ class TypedProperty(object):
         """
         self.cls = cls
         self.name = name
+        self.attr = '_' + name
 
     def __get__(self, instance, owner):
-        target = instance
-        if target is None:
-            target = owner
-        if self.name in target.__dict__:
-            return target.__dict__[self.name]
-        raise AttributeError
+        if instance is None:
+            return self
+        return getattr(instance, self.attr)
 
     def __set__(self, instance, value):
-        if value is None or isinstance(value, self.cls):
-            instance.__dict__[self.name] = value
-        elif isinstance(value, dict):
-            instance.__dict__[self.name] = self.cls(**value)
-        else:
-            raise TypeError("Invalid value '%s', "
-                            "expected dict or '%s'" % (value,
-                                                       self.cls.__name__))
+        setattr(instance, self.attr, _from_dict_or_value(self.cls, value))
+        instance._dict_cache = None
+
+
+def _no_value(obj):
+    """Return None, for fields a class does not have."""
+    return None
+
+
+def _fields_getter(fields):
+    """Return a callable fetching the values of fields from an object."""
+    # attrgetter only accepts native strings on Python 2
+    return attrgetter(*[str(name) for name in fields])
 
 
 class ComparableObject(object):
 
     """Abstract base class for objects implementing equality comparison.
 
-    This class provides default __eq__ and __ne__ implementations.
+    This class provides default __eq__ and __ne__ implementations, comparing
+    the attributes listed in _fields. Subclasses define _values as
+    _fields_getter(_fields).
 
     """
 
+    __slots__ = ()
+    _fields = ()
+    # read the name and rel of items in Array lookups
+    _get_name = _get_rel = staticmethod(_no_value)
+
     def __eq__(self, other):
         """Return True if both instances are equivalent."""
-        return (type(self) == type(other) and
-                self.__dict__ == other.__dict__)
+        values = self._values
+        return self is other or (type(self) is type(other) and
+                                 values(self) == values(other))
 
     def __ne__(self, other):
         """Return True if both instances are not equivalent."""
-        return (type(self) != type(other) or
-                self.__dict__ != other.__dict__)
+        # Python 2 does not derive != from __eq__
+        return not self == other
+
+    def __getstate__(self):
+        # instances have no __dict__, which pickle protocols 0 and 1 need
+        return [getattr(self, name) for name in self._fields]
+
+    def __setstate__(self, state):
+        for name, value in zip(self._fields, state):
+            setattr(self, name, value)
+        self._dict_cache = None
 
 
 class Data(ComparableObject):
 
     """Object representing a Collection+JSON data object."""
 
+    _fields = ('name', 'value', 'prompt', 'array', 'object')
+    _values = _fields_getter(_fields)
+    _get_name = _fields_getter(('name',))
+    __slots__ = _fields + ('_dict_cache',)
+
     def __init__(self, name, value=None, prompt=None, array=None, object=None):
+        self._dict_cache = None
         self.name = name
         self.value = value
         self.array = array
@@ -142,13 +285,13 @@ class Data(ComparableObject):
             raise ValueError('Data can only have one of the three properties.')
 
     def __repr__(self):
-        data = "name='%s'" % self.name
-        if self.prompt is not None:
-            data += " prompt='%s'" % self.prompt
-        return "<Data: %s>" % data
+        prompt = '' if self.prompt is None else " prompt='%s'" % self.prompt
+        return "<Data: name='%s'%s>" % (self.name, prompt)
 
     def to_dict(self):
         """Return a dictionary representing a Data object."""
+        if CACHE_TO_DICT and self._dict_cache is not None:
+            return self._dict_cache
         output = {
             'name': self.name
         }
@@ -160,6 +303,8 @@ class Data(ComparableObject):
             output['object'] = self.object
         if self.prompt is not None:
             output['prompt'] = self.prompt
+        if CACHE_TO_DICT:
+            self._dict_cache = output
         return output
 
 
@@ -167,8 +312,15 @@ class Link(ComparableObject):
 
     """Object representing a Collection+JSON link object."""
 
+    _fields = ('href', 'rel', 'name', 'render', 'prompt', 'length', 'inline')
+    _values = _fields_getter(_fields)
+    _get_name = _fields_getter(('name',))
+    _get_rel = _fields_getter(('rel',))
+    __slots__ = _fields + ('_dict_cache',)
+
     def __init__(self, href, rel, name=None, render=None, prompt=None,
                  length=None, inline=None):
+        self._dict_cache = None
         self.href = href
         self.rel = rel
         self.name = name
@@ -178,21 +330,18 @@ class Link(ComparableObject):
         self.inline = inline
 
     def __repr__(self):
-        data = "rel='%s'" % self.rel
-        if self.name:
-            data += " name='%s'" % self.name
-        if self.render:
-            data += " render='%s'" % self.render
-        if self.prompt:
-            data += " prompt='%s'" % self.prompt
-        if self.length:
-            data += " length='%s'" % self.length
-        if self.inline:
-            data += " inline='%s'" % self.inline
-        return "<Link: %s>" % data
+        return "<Link: rel='%s'%s%s%s%s%s>" % (
+            self.rel,
+            " name='%s'" % self.name if self.name else '',
+            " render='%s'" % self.render if self.render else '',
+            " prompt='%s'" % self.prompt if self.prompt else '',
+            " length='%s'" % self.length if self.length else '',
+            " inline='%s'" % self.inline if self.inline else '')
 
     def to_dict(self):
         """Return a dictionary representing a Link object."""
+        if CACHE_TO_DICT and self._dict_cache is not None:
+            return self._dict_cache
         output = {
             'href': self.href,
             'rel': self.rel,
@@ -207,6 +356,8 @@ class Link(ComparableObject):
             output['length'] = self.length
         if self.inline is not None:
             output['inline'] = self.inline
+        if CACHE_TO_DICT:
+            self._dict_cache = output
         return output
 
 
@@ -214,23 +365,26 @@ class Error(ComparableObject):
 
     """Object representing a Collection+JSON error object."""
 
+    _fields = ('code', 'message', 'title')
+    _values = _fields_getter(_fields)
+    __slots__ = _fields + ('_dict_cache',)
+
     def __init__(self, code=None, message=None, title=None):
+        self._dict_cache = None
         self.code = code
         self.message = message
         self.title = title
 
     def __repr__(self):
-        data = ''
-        if self.code is not None:
-            data += " code='%s'" % self.code
-        if self.message is not None:
-            data += " message='%s'" % self.message
-        if self.title is not None:
-            data += " title='%s'" % self.title
-        return "<Error%s>" % data
+        return "<Error%s%s%s>" % (
+            '' if self.code is None else " code='%s'" % self.code,
+            '' if self.message is None else " message='%s'" % self.message,
+            '' if self.title is None else " title='%s'" % self.title)
 
     def to_dict(self):
         """Return a dictionary representing the Error instance."""
+        if CACHE_TO_DICT and self._dict_cache is not None:
+            return self._dict_cache
         output = {}
         if self.code:
             output['code'] = self.code
@@ -238,6 +392,8 @@ class Error(ComparableObject):
             output['message'] = self.message
         if self.title:
             output['title'] = self.title
+        if CACHE_TO_DICT:
+            self._dict_cache = output
         return output
 
 
@@ -245,6 +401,10 @@ class Template(ComparableObject):
 
     """Object representing a Collection+JSON template object."""
 
+    _fields = ('_data',)
+    _values = _fields_getter(_fields)
+    __slots__ = _fields + ('_dict_cache',)
+
     data = ArrayProperty(Data, "data")
 
     @staticmethod
@@ -254,13 +414,15 @@ class Template(ComparableObject):
         Convenience method for parsing 'write' responses,
         which should only contain a template object.
 
-        This method parses a json string into a Template object.
+        This method parses a json string (or bytes) into a Template object.
+        An already parsed document (a dict) is used as is.
 
         Raises `ValueError` when no valid document is provided.
 
         """
         try:
-            data = json.loads(data)
+            if not isinstance(data, dict):
+                data = _loads(data)
             kwargs = data.get('template')
             if not kwargs:
                 raise ValueError
@@ -271,6 +433,7 @@ class Template(ComparableObject):
         return template
 
     def __init__(self, data=None):
+        self._dict_cache = None
         self.data = data
 
     def __repr__(self):
@@ -278,6 +441,8 @@ class Template(ComparableObject):
         return "<Template: data=%s>" % data
 
     def __getattr__(self, name):
+        if name.startswith('__') or name in type(self).__slots__:
+            raise AttributeError(name)
         return getattr(self.data, name)
 
     @property
@@ -287,43 +452,152 @@ class Template(ComparableObject):
 
     def to_dict(self):
         """Return a dictionary representing a Template object."""
-        return {
+        if CACHE_TO_DICT and self._dict_cache is not None:
+            return self._dict_cache
+        output = {
             'template': self.data.to_dict()
         }
+        if CACHE_TO_DICT:
+            self._dict_cache = output
+        return output
 
 
-class Array(ComparableObject, list):
+class Array(ComparableObject):
 
-    """Object representing a Collection+JSON array."""
+    """Object representing a Collection+JSON array.
+
+    Items are kept in a list and the usual list operations are supported.
+
+    """
+
+    _fields = ('item_class', 'collection_name', '_items')
+    _values = _fields_getter(_fields)
+    __slots__ = _fields + ('_dict_cache',)
 
     def __init__(self, item_class, collection_name, items):
         self.item_class = item_class
         self.collection_name = collection_name
-        super(Array, self).__init__(self._build_items(items))
+        self._dict_cache = None
+        self._items = self._build_items(items)
 
     def _build_items(self, items):
-        result = []
-        for item in items:
-            if isinstance(item, self.item_class):
-                result.append(item)
-            elif isinstance(item, dict):
-                result.append(self.item_class(**item))
-            else:
-                raise ValueError("Invalid value for %s: %r" % (
-                    self.item_class.__name__, item))
-        return result
+        return _build_items(self.item_class, items, _build_item)
 
-    def __eq__(self, other):
-        """Return True if both instances are equivalent."""
-        return (super(Array, self).__eq__(other) and
-                list.__eq__(self, other))
+    def _reset_dict_cache(self):
+        """Forget the to_dict result after a change."""
+        self._dict_cache = None
 
-    def __ne__(self, other):
-        """Return True if both instances are not equivalent."""
-        return (super(Array, self).__ne__(other) or
-                list.__ne__(self, other))
+    def __getstate__(self):
+        # copy the list so copy.copy() doesn't share it with the original
+        return (self.item_class, self.collection_name, list(self._items))
+
+    def __setstate__(self, state):
+        self.item_class, self.collection_name, self._items = state
+        self._reset_dict_cache()
+
+    def __repr__(self):
+        return repr(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __reversed__(self):
+        return reversed(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __setitem__(self, index, value):
+        self._reset_dict_cache()
+        self._items[index] = value
+
+    def __delitem__(self, index):
+        self._reset_dict_cache()
+        del self._items[index]
+
+    def __add__(self, other):
+        return self._items + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self._items
+
+    def __mul__(self, count):
+        return self._items * count
+
+    __rmul__ = __mul__
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, count):
+        self._reset_dict_cache()
+        self._items *= count
+        return self
+
+    def append(self, item):
+        """Append item to the end of the array."""
+        self._reset_dict_cache()
+        self._items.append(item)
+
+    def extend(self, items):
+        """Append all the given items to the end of the array."""
+        self._reset_dict_cache()
+        self._items.extend(items)
+
+    def insert(self, index, item):
+        """Insert item before index."""
+        self._reset_dict_cache()
+        self._items.insert(index, item)
+
+    def clear(self):
+        """Remove all items from the array."""
+        self._reset_dict_cache()
+        del self._items[:]
+
+    def copy(self):
+        """Return a shallow copy of the items as a list."""
+        return list(self._items)
+
+    def pop(self, index=-1):
+        """Remove and return the item at index (default last)."""
+        self._reset_dict_cache()
+        return self._items.pop(index)
+
+    def remove(self, item):
+        """Remove the first occurrence of item."""
+        self._reset_dict_cache()
+        self._items.remove(item)
+
+    def reverse(self):
+        """Reverse the array in place."""
+        self._reset_dict_cache()
+        self._items.reverse()
+
+    def sort(self, *args, **kwargs):
+        """Sort the array in place, accepting the same arguments as list."""
+        self._reset_dict_cache()
+        self._items.sort(*args, **kwargs)
+
+    def index(self, *args):
+        """Return the index of the first occurrence of an item."""
+        return self._items.index(*args)
+
+    def count(self, item):
+        """Return the number of occurrences of item."""
+        return self._items.count(item)
 
     def __getattr__(self, name):
+        if name.startswith('__') or name in type(self).__slots__:
+            # special names and unset slots are never item lookups; this
+            # keeps copy and pickle from recursing
+            raise AttributeError(name)
         results = self.find(name=name)
 
         if not results:
@@ -333,9 +607,11 @@ class Array(ComparableObject, list):
         return results
 
     def _matches(self, name=None, rel=None):
-        for item in self:
-            item_name = getattr(item, 'name', None)
-            item_rel = getattr(item, 'rel', None)
+        get_name = self.item_class._get_name
+        get_rel = self.item_class._get_rel
+        for item in self._items:
+            item_name = get_name(item)
+            item_rel = get_rel(item)
 
             if name is not None and item_name == name and rel is None:
                 # only searching by name
@@ -372,19 +648,20 @@ class Array(ComparableObject, list):
 
     def to_dict(self):
         """Return a dictionary representing an Array object."""
-
+        if CACHE_TO_DICT and self._dict_cache is not None:
+            return self._dict_cache
         if self.item_class is Collection:
             data = {
-                item.href: item.to_dict() for item in self
+                item.href: item.to_dict() for item in self._items
             }
         else:
-            data = [
-                item.to_dict() for item in self
-            ]
+            data = [item.to_dict() for item in self._items]
         if self.collection_name is not None:
-            return {
+            data = {
                 self.collection_name: data
             }
+        if CACHE_TO_DICT:
+            self._dict_cache = data
         return data
 
 
@@ -392,10 +669,15 @@ class Item(ComparableObject):
 
     """Object representing a Collection+JSON item object."""
 
+    _fields = ('href', '_data', '_links')
+    _values = _fields_getter(_fields)
+    __slots__ = _fields + ('_dict_cache',)
+
     data = ArrayProperty(Data, "data")
     links = ArrayProperty(Link, "links")
 
     def __init__(self, href=None, data=None, links=None):
+        self._dict_cache = None
         self.href = href
         self.data = data
         self.links = links
@@ -404,6 +686,8 @@ class Item(ComparableObject):
         return "<Item: href='%s'>" % self.href
 
     def __getattr__(self, name):
+        if name.startswith('__') or name in type(self).__slots__:
+            raise AttributeError(name)
         return getattr(self.data, name)
 
     @property
@@ -413,13 +697,14 @@ class Item(ComparableObject):
 
     def to_dict(self):
         """Return a dictionary representing an Item object."""
-        output = {}
-        if self.href:
-            output['href'] = self.href
-        if self.data:
-            output.update(self.data.to_dict())
-        if self.links:
-            output.update(self.links.to_dict())
+        if CACHE_TO_DICT and self._dict_cache is not None:
+            return self._dict_cache
+        output = {'href': self.href} if self.href else {}
+        for part in (self.data, self.links):
+            if part:
+                output.update(part.to_dict())
+        if CACHE_TO_DICT:
+            self._dict_cache = output
         return output
 
 
@@ -427,9 +712,16 @@ class Query(ComparableObject):
 
     """Object representing a Collection+JSON query object."""
 
+    _fields = ('href', 'rel', 'name', 'prompt', '_data')
+    _values = _fields_getter(_fields)
+    _get_name = _fields_getter(('name',))
+    _get_rel = _fields_getter(('rel',))
+    __slots__ = _fields + ('_dict_cache',)
+
     data = ArrayProperty(Data, "data")
 
     def __init__(self, href, rel, name=None, prompt=None, data=None):
+        self._dict_cache = None
         self.href = href
         self.rel = rel
         self.name = name
@@ -437,15 +729,15 @@ class Query(ComparableObject):
         self.data = data
 
     def __repr__(self):
-        data = "rel='%s'" % self.rel
-        if self.name:
-            data += " name='%s'" % self.name
-        if self.prompt:
-            data += " prompt='%s'" % self.prompt
-        return "<Query: %s>" % data
+        return "<Query: rel='%s'%s%s>" % (
+            self.rel,
+            " name='%s'" % self.name if self.name else '',
+            " prompt='%s'" % self.prompt if self.prompt else '')
 
     def to_dict(self):
         """Return a dictionary representing a Query object."""
+        if CACHE_TO_DICT and self._dict_cache is not None:
+            return self._dict_cache
         output = {
             'href': self.href,
             'rel': self.rel,
@@ -454,8 +746,10 @@ class Query(ComparableObject):
             output['name'] = self.name
         if self.prompt is not None:
             output['prompt'] = self.prompt
-        if len(self.data):
+        if self.data:
             output.update(self.data.to_dict())
+        if CACHE_TO_DICT:
+            self._dict_cache = output
         return output
 
 
@@ -463,21 +757,38 @@ class Collection(ComparableObject):
 
     """Object representing a Collection+JSON document."""
 
+    _fields = ('version', 'href', '_error', '_errors', '_template', '_items',
+               '_links', '_inline', '_queries')
+    _values = _fields_getter(_fields)
+    __slots__ = _fields + ('_dict_cache',)
+
+    error = TypedProperty(Error, 'error')
+    errors = DictProperty(Error, 'errors')
+    template = TypedProperty(Template, 'template')
+    items = ArrayProperty(Item, 'items')
+    links = ArrayProperty(Link, 'links')
+    # inline is set below, once Collection is defined
+    queries = ArrayProperty(Query, 'queries')
+
     @staticmethod
     def from_json(data):
         """Return a Collection instance.
 
-        This method parses a json string into a Collection object.
+        This method parses a json string (or bytes) into a Collection object.
+        An already parsed document (a dict) is used as is.
 
         Raises `ValueError` when no valid document is provided.
 
         """
         try:
-            data = json.loads(data)
+            if not isinstance(data, dict):
+                data = _loads(data)
             kwargs = data.get('collection')
             if not kwargs:
                 raise ValueError
             if 'inline' in kwargs and kwargs['inline']:
+                # don't modify a document owned by the caller
+                kwargs = dict(kwargs)
                 kwargs['inline'] = [Collection(**data.get('collection'))
                                     for data in kwargs['inline'].values()]
         except ValueError:
@@ -486,18 +797,9 @@ class Collection(ComparableObject):
         collection = Collection(**kwargs)
         return collection
 
-    def __new__(cls, *args, **kwargs):
-        cls.error = TypedProperty(Error, 'error')
-        cls.errors = DictProperty(Error, 'errors')
-        cls.template = TypedProperty(Template, 'template')
-        cls.items = ArrayProperty(Item, 'items')
-        cls.links = ArrayProperty(Link, 'links')
-        cls.inline = ArrayProperty(Collection, 'inline')
-        cls.queries = ArrayProperty(Query, 'queries')
-        return super(Collection, cls).__new__(cls)
-
     def __init__(self, href, links=None, items=None, inline=None, queries=None,
                  template=None, error=None, errors=None, version='1.0'):
+        self._dict_cache = None
         self.version = version
         self.href = href
 
@@ -514,28 +816,30 @@ class Collection(ComparableObject):
             self.version, self.href)
 
     def __str__(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         """Return a dictionary representing a Collection object."""
-        output = {
-            'collection': {
-                'version': self.version,
-                'href': self.href,
-            }
+        if CACHE_TO_DICT and self._dict_cache is not None:
+            return self._dict_cache
+        collection = {
+            'version': self.version,
+            'href': self.href,
         }
-        if self.links:
-            output['collection'].update(self.links.to_dict())
-        if self.items:
-            output['collection'].update(self.items.to_dict())
-        if self.inline:
-            output['collection'].update(self.inline.to_dict())
-        if self.queries:
-            output['collection'].update(self.queries.to_dict())
-        if self.template:
-            output['collection'].update(self.template.to_dict())
-        if self.error:
-            output['collection'].update(self.error.to_dict())
+        for part in (self.links, self.items, self.inline, self.queries,
+                     self.template, self.error):
+            if part:
+                collection.update(part.to_dict())
         if self.errors:
-            output['collection']['errors'] = {name : value.to_dict() for name, value in self.errors.items()}
+            collection['errors'] = {
+                name: value.to_dict() for name, value in self.errors.items()
+            }
+        output = {
+            'collection': collection
+        }
+        if CACHE_TO_DICT:
+            self._dict_cache = output
         return output
+
+
+Collection.inline = ArrayProperty(Collection, 'inline')
@@ -1,7 +1,14 @@
 try:
     from setuptools import setup
+    from setuptools.command.build_ext import build_ext
 except ImportError:
     from distutils.core import setup
+    from distutils.command.build_ext import build_ext
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
 
 import collection_json
 
@@ -16,6 +23,32 @@ classifiers = [
 ]
 
 
+class optional_build_ext(build_ext):
+
+    """Build the optional C speedups, ignoring any build failure."""
+
+    def run(self):
+        try:
+            build_ext.run(self)
+        except Exception as e:
+            self.warn('skipping C speedups: %s' % e)
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except Exception as e:
+            self.warn('skipping C speedups: %s' % e)
+
+
+ext_modules = []
+if cythonize is not None:
+    try:
+        ext_modules = cythonize('_collection_json_speedups.pyx')
+    except Exception as e:
+        # the speedups are optional, install the pure Python module alone
+        print('skipping C speedups: %s' % e)
+
+
 setup(
     name='collection-json',
     version=collection_json.__version__,
@@ -23,6 +56,8 @@ setup(
     author_email='ricardo@kirkner.com.ar',
     url='http://pypi.python.org/pypi/collection-json',
     py_modules=['collection_json'],
+    ext_modules=ext_modules,
+    cmdclass={'build_ext': optional_build_ext},
     description='Small library to work with Collection+JSON documents.',
     long_description=open('README.txt').read(),
     license='BSD',
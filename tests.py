@@ -1,7 +1,12 @@
 from __future__ import absolute_import, unicode_literals
+import copy
 import json
-from unittest import TestCase
+import pickle
+import sys
+from collections import OrderedDict
+from unittest import TestCase, skipIf
 
+import collection_json
 from collection_json import (
     Array,
     ArrayProperty,
@@ -15,8 +20,22 @@ from collection_json import (
     TypedProperty
 )
 
+try:
+    import _collection_json_speedups as speedups
+except ImportError:
+    speedups = None
 
-class CollectionTestCase(TestCase):
+
+class ModuleSettingsMixin(object):
+
+    def _override(self, name, value):
+        """Set a collection_json module attribute for the current test."""
+        self.addCleanup(setattr, collection_json, name,
+                        getattr(collection_json, name))
+        setattr(collection_json, name, value)
+
+
+class CollectionTestCase(ModuleSettingsMixin, TestCase):
 
     def test_from_json_invalid_data(self):
         with self.assertRaises(ValueError):
@@ -30,6 +49,64 @@ class CollectionTestCase(TestCase):
         with self.assertRaises(ValueError):
             Collection.from_json('{"collection": {}}')
 
+    def test_from_json_bytes(self):
+        collection = Collection.from_json(
+            b'{"collection": {"href": "http://example.org"}}')
+        self.assertEqual(collection.href, 'http://example.org')
+
+    def test_from_json_bytes_stdlib_json(self):
+        self._override('USE_FAST_JSON', False)
+        collection = Collection.from_json(
+            b'{"collection": {"href": "http://example.org"}}')
+        self.assertEqual(collection.href, 'http://example.org')
+
+    def test_from_json_non_finite_numbers(self):
+        collection = Collection.from_json(
+            '{"collection": {"href": "href", "template": {"data": ['
+            '{"name": "nan", "value": NaN},'
+            '{"name": "inf", "value": Infinity}]}}}')
+        self.assertNotEqual(collection.template.nan.value,
+                            collection.template.nan.value)
+        self.assertEqual(collection.template.inf.value, float('inf'))
+
+    def test_from_json_large_integer_stdlib_json(self):
+        self._override('USE_FAST_JSON', False)
+        collection = Collection.from_json(
+            '{"collection": {"href": "href", "template": {"data": ['
+            '{"name": "large", "value": %d}]}}}' % 2 ** 70)
+        self.assertEqual(collection.template.large.value, 2 ** 70)
+
+    @skipIf(collection_json.orjson is None, 'orjson is not installed')
+    def test_from_json_large_integer_orjson(self):
+        # documented precision loss, see USE_FAST_JSON
+        collection = Collection.from_json(
+            '{"collection": {"href": "href", "template": {"data": ['
+            '{"name": "large", "value": %d}]}}}' % 2 ** 70)
+        self.assertEqual(collection.template.large.value, float(2 ** 70))
+
+    def test_from_json_dict(self):
+        data = {'collection': {'href': 'http://example.org'}}
+        collection = Collection.from_json(data)
+        self.assertEqual(collection.href, 'http://example.org')
+
+    def test_from_json_dict_with_inline_data(self):
+        data = {
+            'collection': {
+                'href': 'http://example.org',
+                'inline': {
+                    'http://example.org/inline': {
+                        'collection': {'href': 'http://example.org/inline'}
+                    }
+                }
+            }
+        }
+        inline = dict(data['collection']['inline'])
+        collection = Collection.from_json(data)
+        self.assertEqual(collection.inline,
+                         Array(Collection, 'inline',
+                               [Collection('http://example.org/inline')]))
+        self.assertEqual(data['collection']['inline'], inline)
+
     def test_from_json_minimal(self):
         collection = Collection.from_json(
             '{"collection": {"href": "http://example.org"}}')
@@ -175,6 +252,9 @@ class CollectionTestCase(TestCase):
         query = Query('href', 'rel')
         self.assertEqual(collection.queries, Array(Query, 'queries', [query]))
 
+    def test_collection_has_no_instance_dict(self):
+        self.assertFalse(hasattr(Collection('href'), '__dict__'))
+
     def test_collection_required_parameters(self):
         with self.assertRaises(TypeError):
             Collection()
@@ -385,6 +465,40 @@ class CollectionTestCase(TestCase):
         }
         self.assertEqual(collection.to_dict(), expected)
 
+    def test_to_dict_not_cached_by_default(self):
+        collection = Collection('href')
+        self.assertIsNot(collection.to_dict(), collection.to_dict())
+
+    def test_to_dict_cached(self):
+        self._override('CACHE_TO_DICT', True)
+        collection = Collection('href', items=[Item('item')])
+        self.assertIs(collection.to_dict(), collection.to_dict())
+
+    def test_to_dict_cache_reset_on_set(self):
+        self._override('CACHE_TO_DICT', True)
+        collection = Collection('href')
+        collection.to_dict()
+        collection.items = [Item('item')]
+        self.assertEqual(collection.to_dict()['collection']['items'],
+                         [{'href': 'item'}])
+
+    def test_pickle(self):
+        collection = Collection('href', items=[
+            Item('item', data=[Data('name', 'value')],
+                 links=[Link('href', 'rel')])
+        ], template=Template([Data('name')]))
+        self.assertEqual(pickle.loads(pickle.dumps(collection)), collection)
+
+    def test_pickle_all_protocols(self):
+        collection = Collection('href', items=[
+            Item('item', data=[Data('name', 'value')],
+                 links=[Link('href', 'rel')])
+        ], queries=[Query('href', 'rel', data=[Data('q')])],
+            error=Error('code'), template=Template([Data('name')]))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(collection, protocol)), collection)
+
     def test_repr(self):
         collection = Collection('href')
         self.assertEqual(
@@ -392,6 +506,19 @@ class CollectionTestCase(TestCase):
             "<Collection: version='1.0' href='href'>")
 
     def test_str(self):
+        collection = Collection('href')
+        self.assertEqual(json.loads(str(collection)), collection.to_dict())
+
+    def test_str_unsupported_by_fast_json(self):
+        collection = Collection('href', template={'data': [
+            {'name': 'object', 'object': {1: 'x'}},
+            {'name': 'value', 'value': 2 ** 70},
+        ]})
+        self.assertEqual(json.loads(str(collection)),
+                         json.loads(json.dumps(collection.to_dict())))
+
+    def test_str_stdlib_json(self):
+        self._override('USE_FAST_JSON', False)
         collection = Collection('href')
         expected = json.dumps(collection.to_dict())
         self.assertEqual(str(collection), expected)
@@ -483,6 +610,79 @@ class CollectionTestCase(TestCase):
         self.assertEqual(collection, expected)
 
 
+class JsonBackendTestCase(ModuleSettingsMixin, TestCase):
+
+    class Backend(object):
+        """Stand-in for a fast json module, recording the calls made."""
+
+        def __init__(self):
+            self.calls = []
+            self.error = None
+
+        def loads(self, data):
+            self.calls.append('loads')
+            if self.error is not None:
+                raise self.error
+            return json.loads(data)
+
+        def dumps(self, obj, **kwargs):
+            self.calls.append('dumps')
+            if self.error is not None:
+                raise self.error
+            return json.dumps(obj)
+
+    document = '{"collection": {"href": "http://example.org"}}'
+
+    def setUp(self):
+        self.simdjson = self.Backend()
+        self.ujson = self.Backend()
+        self._override('orjson', None)
+        self._override('simdjson', self.simdjson)
+        self._override('ujson', self.ujson)
+
+    def test_loads_prefers_simdjson(self):
+        collection = Collection.from_json(self.document)
+        self.assertEqual(collection.href, 'http://example.org')
+        self.assertEqual(self.simdjson.calls, ['loads'])
+        self.assertEqual(self.ujson.calls, [])
+
+    def test_loads_ujson(self):
+        self._override('simdjson', None)
+        collection = Collection.from_json(self.document)
+        self.assertEqual(collection.href, 'http://example.org')
+        self.assertEqual(self.ujson.calls, ['loads'])
+
+    def test_loads_error_falls_back_to_stdlib_json(self):
+        self.simdjson.error = ValueError('unsupported document')
+        collection = Collection.from_json(self.document)
+        self.assertEqual(collection.href, 'http://example.org')
+        self.assertEqual(self.simdjson.calls, ['loads'])
+        self.assertEqual(self.ujson.calls, [])
+
+    def test_loads_invalid_document(self):
+        self.simdjson.error = ValueError('invalid document')
+        with self.assertRaises(ValueError):
+            Collection.from_json('{')
+
+    def test_loads_disabled(self):
+        self._override('USE_FAST_JSON', False)
+        Collection.from_json(self.document)
+        self.assertEqual(self.simdjson.calls, [])
+        self.assertEqual(self.ujson.calls, [])
+
+    def test_dumps_ujson(self):
+        collection = Collection('href')
+        self.assertEqual(json.loads(str(collection)), collection.to_dict())
+        self.assertEqual(self.ujson.calls, ['dumps'])
+        self.assertEqual(self.simdjson.calls, [])
+
+    def test_dumps_error_falls_back_to_stdlib_json(self):
+        self.ujson.error = OverflowError('int too big to convert')
+        collection = Collection('href')
+        self.assertEqual(str(collection), json.dumps(collection.to_dict()))
+        self.assertEqual(self.ujson.calls, ['dumps'])
+
+
 class ErrorTestCase(TestCase):
 
     def test_error_minimal(self):
@@ -609,6 +809,11 @@ class TemplateTestCase(TestCase):
         template = Template([data])
         self.assertEqual(template.name, data)
 
+    def test_attribute_lookup_underscore_name(self):
+        data = Data('_id', 1)
+        template = Template([data])
+        self.assertEqual(template._id, data)
+
     def test_template_from_json_no_error(self):
         expected = {
             'template': {
@@ -622,6 +827,11 @@ class TemplateTestCase(TestCase):
         template = Template.from_json(data)
         self.assertEqual(template.to_dict(), expected)
 
+    def test_template_from_json_dict(self):
+        data = {'template': {'data': [{'name': 'name', 'value': 'value'}]}}
+        template = Template.from_json(data)
+        self.assertEqual(template, Template([Data('name', 'value')]))
+
     def test_template_from_json_collection(self):
         expected = {
             'collection': {
@@ -667,6 +877,21 @@ class ItemTestCase(TestCase):
         self.assertEqual(item.data, Array(Data, 'data', data))
         self.assertEqual(item.links, Array(Link, 'links', links))
 
+    def test_item_equal(self):
+        item1 = Item('href', [Data('name', 'value')])
+        item2 = Item('href', [Data('name', 'value')])
+        self.assertEqual(item1, item2)
+        self.assertFalse(item1 != item2)
+
+    def test_item_not_equal(self):
+        item1 = Item('href', [Data('name', 'value')])
+        item2 = Item('href', [Data('name', 'other')])
+        self.assertNotEqual(item1, item2)
+        self.assertNotEqual(item1, Link('href', 'rel'))
+
+    def test_item_has_no_instance_dict(self):
+        self.assertFalse(hasattr(Item(), '__dict__'))
+
     def test_repr(self):
         data = [Data('name')]
         links = [Link('href', 'rel')]
@@ -703,11 +928,24 @@ class ItemTestCase(TestCase):
         item = Item(data=data)
         self.assertEqual(item.properties, ['name', 'other'])
 
+    def test_properties_after_change(self):
+        item = Item(data=[Data('name')])
+        self.assertEqual(item.properties, ['name'])
+        item.data.append(Data('other'))
+        self.assertEqual(item.properties, ['name', 'other'])
+        item.data[0].name = 'renamed'
+        self.assertEqual(item.properties, ['renamed', 'other'])
+
     def test_attribute_lookup(self):
         data = Data('name')
         item = Item(data=[data])
         self.assertEqual(item.name, data)
 
+    def test_attribute_lookup_underscore_name(self):
+        data = Data('_id', 1)
+        item = Item(data=[data])
+        self.assertEqual(item._id, data)
+
     def test_set_data_invalid(self):
         item = Item()
         invalid_obj = object()
@@ -737,7 +975,7 @@ class ItemTestCase(TestCase):
         self.assertEqual(item, expected)
 
 
-class DataTestCase(TestCase):
+class DataTestCase(ModuleSettingsMixin, TestCase):
     def test_data_minimal(self):
         data = Data('name')
         self.assertEqual(data.name, 'name')
@@ -750,6 +988,16 @@ class DataTestCase(TestCase):
         self.assertEqual(data.value, 'value')
         self.assertEqual(data.prompt, 'prompt')
 
+    @skipIf(sys.version_info < (3, 7), 'dicts are not ordered')
+    def test_to_dict_key_order(self):
+        data = Data('name', 'value', 'prompt')
+        self.assertEqual(list(data.to_dict())[0], 'name')
+
+    def test_to_dict_value_precedence(self):
+        data = Data('name', object={'a': 1})
+        data.value = 'value'
+        self.assertEqual(data.to_dict(), {'name': 'name', 'value': 'value'})
+
     def test_repr(self):
         data = Data('name', 'value', 'prompt')
         expected = "<Data: name='name' prompt='prompt'>"
@@ -798,6 +1046,11 @@ class QueryTestCase(TestCase):
         self.assertEqual(query.prompt, 'prompt')
         self.assertEqual(query.data, Array(Data, 'data', data))
 
+    @skipIf(sys.version_info < (3, 7), 'dicts are not ordered')
+    def test_to_dict_key_order(self):
+        query = Query('href', 'rel', name='name', prompt='prompt')
+        self.assertEqual(list(query.to_dict())[:2], ['href', 'rel'])
+
     def test_repr_minimal(self):
         query = Query('href', 'rel')
         expected = "<Query: rel='rel'>"
@@ -852,7 +1105,7 @@ class QueryTestCase(TestCase):
         self.assertEqual(query, expected)
 
 
-class LinkTestCase(TestCase):
+class LinkTestCase(ModuleSettingsMixin, TestCase):
     def test_link_minimal(self):
         link = Link('href', 'rel')
         self.assertEqual(link.href, 'href')
@@ -869,6 +1122,11 @@ class LinkTestCase(TestCase):
         self.assertEqual(link.render, 'render')
         self.assertEqual(link.prompt, 'prompt')
 
+    @skipIf(sys.version_info < (3, 7), 'dicts are not ordered')
+    def test_to_dict_key_order(self):
+        link = Link('href', 'rel', name='name', prompt='prompt')
+        self.assertEqual(list(link.to_dict())[:2], ['href', 'rel'])
+
     def test_repr_minimal(self):
         link = Link('href', 'rel')
         expected = "<Link: rel='rel'>"
@@ -910,7 +1168,16 @@ class LinkTestCase(TestCase):
         self.assertEqual(link.to_dict(), expected)
 
 
-class ArrayTestCase(TestCase):
+class ArrayBuildMixin(ModuleSettingsMixin):
+
+    """Array construction tests, run against each build_items function."""
+
+    build_items = None
+
+    def setUp(self):
+        super(ArrayBuildMixin, self).setUp()
+        self._override('_build_items', self.build_items)
+
     def test_init(self):
         item_class = dict
         array = Array(item_class, 'collection', [])
@@ -918,10 +1185,38 @@ class ArrayTestCase(TestCase):
         self.assertEqual(array.collection_name, 'collection')
         self.assertEqual(list(array), [])
 
+    def test_items(self):
+        data = Data('bar')
+        array = Array(Data, 'data', [{'name': 'foo'}, data])
+        self.assertEqual(list(array), [Data('foo'), data])
+        self.assertIs(array[1], data)
+
     def test_invalid_items(self):
         with self.assertRaises(ValueError):
             Array(Data, 'data', [1, 2, 3])
 
+    def test_dict_subclass_items(self):
+        array = Array(Data, 'data', [OrderedDict(name='name')])
+        self.assertEqual(list(array), [Data('name')])
+
+    def test_item_class_subclass_items(self):
+        class SubData(Data):
+            __slots__ = ()
+        data = SubData('name')
+        array = Array(Data, 'data', [data])
+        self.assertIs(array[0], data)
+
+
+class PyArrayBuildTestCase(ArrayBuildMixin, TestCase):
+    build_items = staticmethod(collection_json._py_build_items)
+
+
+@skipIf(speedups is None, 'C speedups are not built')
+class CArrayBuildTestCase(ArrayBuildMixin, TestCase):
+    build_items = staticmethod(getattr(speedups, 'build_items', None))
+
+
+class ArrayTestCase(ModuleSettingsMixin, TestCase):
     def test_equal(self):
         array1 = Array(dict, 'items', [{1: 1}])
         array2 = Array(dict, 'items', [{1: 1}])
@@ -933,6 +1228,71 @@ class ArrayTestCase(TestCase):
         list1 = [{1: 1}]
         self.assertNotEqual(array1, list1)
 
+    def test_not_equal_item_class(self):
+        array1 = Array(Link, 'links', [])
+        array2 = Array(Item, 'links', [])
+        self.assertTrue(array1 != array2)
+        self.assertFalse(array1 != Array(Link, 'links', []))
+
+    def test_to_dict_cache_reset_on_mutation(self):
+        self._override('CACHE_TO_DICT', True)
+        links = Array(Link, 'links', [])
+        links.to_dict()
+        links.append(Link('href', 'rel'))
+        self.assertEqual(links.to_dict(),
+                         {'links': [{'href': 'href', 'rel': 'rel'}]})
+
+    def test_list_operations(self):
+        link1 = Link('href1', rel='foo')
+        link2 = Link('href2', rel='bar')
+        links = Array(Link, 'links', [link1])
+        links.append(link2)
+        self.assertEqual(len(links), 2)
+        self.assertEqual(links[1], link2)
+        self.assertEqual(links[:1], [link1])
+        self.assertIn(link2, links)
+        self.assertEqual(links.index(link2), 1)
+        del links[0]
+        self.assertEqual(list(links), [link2])
+        self.assertEqual(repr(links), repr([link2]))
+        self.assertTrue(links)
+        self.assertFalse(Array(Link, 'links', []))
+
+        links = Array(Link, 'links', [link1])
+        self.assertEqual(links + [link2], [link1, link2])
+        self.assertEqual([link2] + links, [link2, link1])
+        self.assertEqual(links * 2, [link1, link1])
+        self.assertEqual(2 * links, [link1, link1])
+        copied = links.copy()
+        self.assertEqual(copied, [link1])
+        copied.append(link2)
+        self.assertEqual(len(links), 1)
+        links += [link2]
+        self.assertIsInstance(links, Array)
+        self.assertEqual(list(links), [link1, link2])
+        links.clear()
+        self.assertEqual(list(links), [])
+
+    def test_copy_is_independent(self):
+        links = Array(Link, 'links', [Link('href', rel='foo')])
+        copied = copy.copy(links)
+        copied.append(Link('href2', rel='bar'))
+        self.assertEqual(len(links), 1)
+
+    def test_pickle(self):
+        links = Array(Link, 'links', [Link('href', rel='foo', name='bar')])
+        self.assertEqual(pickle.loads(pickle.dumps(links)), links)
+
+    def test_copy(self):
+        links = Array(Link, 'links', [Link('href', rel='foo', name='bar')])
+        self.assertEqual(copy.copy(links), links)
+
+    def test_deepcopy(self):
+        links = Array(Link, 'links', [Link('href', rel='foo', name='bar')])
+        copied = copy.deepcopy(links)
+        self.assertEqual(copied, links)
+        self.assertIsNot(copied[0], links[0])
+
     def test_find_by_rel(self):
         link = Link('href', rel='foo')
         links = Array(Link, 'links', [link])
@@ -955,6 +1315,41 @@ class ArrayTestCase(TestCase):
         self.assertEqual(links.find(rel='foo'), [link])
         self.assertEqual(links.find(name='bar'), [link])
 
+    def test_find_after_append(self):
+        link1 = Link('href1', rel='foo')
+        link2 = Link('href2', rel='foo')
+        links = Array(Link, 'links', [link1])
+        self.assertEqual(links.find(rel='foo'), [link1])
+        links.append(link2)
+        self.assertEqual(links.find(rel='foo'), [link1, link2])
+
+    def test_find_after_setitem(self):
+        links = Array(Link, 'links', [Link('href', rel='foo')])
+        self.assertEqual(len(links.find(rel='foo')), 1)
+        links[0] = Link('href', rel='bar')
+        self.assertEqual(links.find(rel='foo'), [])
+
+    def test_find_after_item_change(self):
+        links = Array(Link, 'links', [Link('href', rel='old')])
+        self.assertEqual(len(links.find(rel='old')), 1)
+        links[0].rel = 'new'
+        self.assertEqual(links.find(rel='old'), [])
+        self.assertEqual(links.find(rel='new'), [links[0]])
+
+    def test_attribute_lookup_after_item_change(self):
+        item = Item(data=[Data('a')])
+        item.a
+        item.data[0].name = 'b'
+        self.assertEqual(item.b, item.data[0])
+        with self.assertRaises(AttributeError):
+            item.a
+
+    def test_find_without_rel_attribute(self):
+        data = Data('foo')
+        array = Array(Data, 'data', [data])
+        self.assertEqual(array.find(name='foo'), [data])
+        self.assertEqual(array.find(name='foo', rel='bar'), [])
+
     def test_find_by_name_not_found(self):
         link = Link('href', rel='foo', name='bar')
         links = Array(Link, 'links', [link])
@@ -1036,6 +1431,11 @@ class ArrayTestCase(TestCase):
         links = Array(Link, 'links', [foo])
         self.assertEqual(links.bar, foo)
 
+    def test_attribute_lookup_underscore_name(self):
+        link = Link('href', rel='foo', name='_id')
+        links = Array(Link, 'links', [link])
+        self.assertEqual(links._id, link)
+
     def test_attribute_lookup_by_name_not_found(self):
         links = Array(Link, 'links', [])
         with self.assertRaises(AttributeError):